@@ -1,29 +1,51 @@
+import { lazy, Suspense } from 'react'
 import { Routes, Route, Navigate } from 'react-router-dom'
 import { ThemeProvider } from './context/ThemeContext'
 import { ColorSchemeProvider } from './context/ColorSchemeContext'
 import { ZoomProvider } from './context/ZoomContext'
 import { usePinchZoom } from './hooks/usePinchZoom'
-import GraphView from './pages/GraphView'
 import StructuresView from './pages/StructuresView'
 import IosInstallBanner from './components/IosInstallBanner'
 import './App.css'
 
+// The graph list is the landing route, so it stays in the main bundle; only the
+// graph editor is its own chunk. After a deploy, a tab still on the old build can
+// ask for a hashed chunk that no longer exists (Pages answers with the 404.html
+// copy of index.html) — reload once to pick up the new build instead of
+// unmounting to a blank page.
+const CHUNK_RELOAD_KEY = 'graphview_chunk_reload'
+const GraphView = lazy(() =>
+  import('./pages/GraphView')
+    .then(mod => {
+      sessionStorage.removeItem(CHUNK_RELOAD_KEY)
+      return mod
+    })
+    .catch(err => {
+      if (sessionStorage.getItem(CHUNK_RELOAD_KEY)) throw err
+      sessionStorage.setItem(CHUNK_RELOAD_KEY, '1')
+      window.location.reload()
+      return new Promise<never>(() => {})
+    })
+)
+
 function AppContent() {
   usePinchZoom()
 
   return (
     <div className="app">
       <IosInstallBanner />
-      <Routes>
-        {/* Root: list of all graphs */}
-        <Route path="/" element={<StructuresView />} />
+      <Suspense fallback={<div className="loading">Loading...</div>}>
+        <Routes>
+          {/* Root: list of all graphs */}
+          <Route path="/" element={<StructuresView />} />
 
-        {/* Graph view: /g/{graphName}/* */}
-        <Route path="/g/:graphName/*" element={<GraphView />} />
+          {/* Graph view: /g/{graphName}/* */}
+          <Route path="/g/:graphName/*" element={<GraphView />} />
 
-        {/* Unmatched routes go home */}
-        <Route path="/*" element={<Navigate to="/" replace />} />
-      </Routes>
+          {/* Unmatched routes go home */}
+          <Route path="/*" element={<Navigate to="/" replace />} />
+        </Routes>
+      </Suspense>
     </div>
   )
 }
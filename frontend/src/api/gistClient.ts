@@ -109,10 +109,10 @@ export async function fetchGist(pat: string, gistId: string): Promise<GistData>
 
   // Fetch truncated files individually via raw_url
   await Promise.all(
-    Object.entries(data.files).map(async ([name, file]) => {
+    Object.values(data.files).map(async file => {
       if (file.truncated && file.raw_url) {
         const raw = await fetch(file.raw_url)
-        if (raw.ok) data.files[name].content = await raw.text()
+        if (raw.ok) file.content = await raw.text()
       }
     })
   )
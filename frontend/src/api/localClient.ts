@@ -11,6 +11,9 @@ export interface StructureItem {
   // done===total (e.g. "1/1", "5/5"); see getItemDueDate.
   checkpoints?: { date: string; progress: string }[]
   children?: Record<string, StructureItem>
+  // Set only on the Overview's virtual items: they are read-only and point back at the real item
+  nonEditable?: boolean
+  originalPath?: string
   [key: string]: unknown
 }
 
@@ -52,9 +55,14 @@ const DELETED_KEY    = 'offline_deleted_graphs'
 const dataKey  = (n: string) => `offline_graph_${n}`
 const metaKey  = (n: string) => `offline_meta_${n}`
 const GRAPH_ICONS = ['📊','🎯','📚','💼','🏠','🌟','🚀','💡','🎨','🔬']
-const iconFor = (name: string) =>
+// Stable per-name icon (hash of char codes) — also the fallback icon in the graph list
+export const iconForGraph = (name: string) =>
   GRAPH_ICONS[name.split('').reduce((a, c) => a + c.charCodeAt(0), 0) % GRAPH_ICONS.length]
 
+// "my_graph_name" -> "My Graph Name"
+export const titleFromKey = (key: string) =>
+  key.replace(/_/g, ' ').replace(/\b\w/g, c => c.toUpperCase())
+
 // ── Persistence helpers ──────────────────────────────────────────────────────
 function getGraphNames(): string[] {
   try { return JSON.parse(localStorage.getItem(GRAPHS_LIST_KEY) ?? '[]') }
@@ -98,13 +106,13 @@ function loadMeta(graphName: string): GraphInfo {
   } catch { /* fall through */ }
   return {
     name: graphName,
-    display_name: graphName.replace(/_/g, ' ').replace(/\b\w/g, c => c.toUpperCase()),
+    display_name: titleFromKey(graphName),
     path: `structures/${graphName}.txt`,
     modified_at: new Date().toISOString(),
     size: 0,
     description: '',
     version: '1.0',
-    icon: iconFor(graphName),
+    icon: iconForGraph(graphName),
   }
 }
 function saveMeta(graphName: string, meta: GraphInfo) {
@@ -115,14 +123,39 @@ function touchMeta(graphName: string) {
   saveMeta(graphName, { ...m, modified_at: new Date().toISOString() })
 }
 
+// ── Tree walking ─────────────────────────────────────────────────────────────
+// Preorder walk of an item tree with an explicit stack — no recursion and no
+// per-level result arrays spread into the parent's. Entries are pushed in reverse
+// so items are visited in document order. An item's children are read only after
+// `visit` returns, so the callback may fill them in.
+export function walkItems(
+  items: Record<string, StructureItem>,
+  parentPath: string,
+  visit: (itemPath: string, key: string, item: StructureItem) => void
+) {
+  const stack: Array<[string, string, StructureItem]> = []
+  const pushChildren = (children: Record<string, StructureItem>, prefix: string) => {
+    const entries = Object.entries(children)
+    for (let i = entries.length - 1; i >= 0; i--) {
+      const [key, item] = entries[i]
+      stack.push([prefix ? `${prefix}.${key}` : key, key, item])
+    }
+  }
+  pushChildren(items, parentPath)
+  while (stack.length > 0) {
+    const [itemPath, key, item] = stack.pop()!
+    visit(itemPath, key, item)
+    if (item.children) pushChildren(item.children, itemPath)
+  }
+}
+
 // ── ID / title injection (mirrors server behaviour) ──────────────────────────
 function injectIds(items: Record<string, StructureItem>, parentId = '') {
-  for (const [key, item] of Object.entries(items)) {
-    item.id = parentId ? `${parentId}.${key}` : key
-    if (!item.title) item.title = key.replace(/_/g, ' ').replace(/\b\w/g, c => c.toUpperCase())
+  walkItems(items, parentId, (id, key, item) => {
+    item.id = id
+    if (!item.title) item.title = titleFromKey(key)
     if (!item.children) item.children = {}
-    injectIds(item.children, item.id)
-  }
+  })
 }
 
 // A due date is a checkpoint whose progress normalizes to done===total — the
@@ -132,7 +165,12 @@ function injectIds(items: Record<string, StructureItem>, parentId = '') {
 export function getItemDueDate(item: Pick<StructureItem, 'checkpoints'>): string | undefined {
   const cps = item.checkpoints
   if (!cps || !cps.length) return undefined
-  const last = [...cps].sort((a, b) => a.date.localeCompare(b.date))[cps.length - 1]
+  // Only the latest entry matters, so one linear pass instead of copying + sorting
+  // (ties resolve to the later entry, same as the last element of a stable sort)
+  let last = cps[0]
+  for (let i = 1; i < cps.length; i++) {
+    if (cps[i].date.localeCompare(last.date) >= 0) last = cps[i]
+  }
   const m = last.progress.match(/^(\d+)\/(\d+)$/)
   if (!m || m[1] !== m[2]) return undefined
   return last.date
@@ -152,14 +190,19 @@ export interface ValueTotal { actual: number; target?: number }
 // added into an ancestor's rollup (that would double-count it on top of its own
 // children). Only true leaves contribute to the actual sum.
 function accumulateLeafValues(item: StructureItem, totals: Record<string, number>): void {
-  const children = item.children ? Object.values(item.children) : []
-  if (children.length === 0) {
-    if (item.cost && typeof item.cost.amount === 'number' && !isNaN(item.cost.amount) && item.cost.unit) {
-      totals[item.cost.unit] = (totals[item.cost.unit] ?? 0) + item.cost.amount
+  // Explicit stack, children pushed in reverse so leaves are summed in document order
+  const stack: StructureItem[] = [item]
+  while (stack.length > 0) {
+    const node = stack.pop()!
+    const children = node.children ? Object.values(node.children) : []
+    if (children.length === 0) {
+      if (node.cost && typeof node.cost.amount === 'number' && !isNaN(node.cost.amount) && node.cost.unit) {
+        totals[node.cost.unit] = (totals[node.cost.unit] ?? 0) + node.cost.amount
+      }
+      continue
     }
-    return
+    for (let i = children.length - 1; i >= 0; i--) stack.push(children[i])
   }
-  for (const child of children) accumulateLeafValues(child, totals)
 }
 
 // Leaf: its own value, shown plainly. Parent: sum of all leaf values in its
@@ -168,24 +211,26 @@ function accumulateLeafValues(item: StructureItem, totals: Record<string, number
 // Walks the real item.children tree to unbounded depth, independent of how
 // many levels Section.tsx renders at once.
 export function sumValues(item: StructureItem): Record<string, ValueTotal> {
+  const hasCost = !!item.cost && typeof item.cost.amount === 'number' && !isNaN(item.cost.amount) && !!item.cost.unit
   const hasChildren = !!item.children && Object.keys(item.children).length > 0
-  const totals: Record<string, number> = {}
 
-  if (hasChildren) {
-    for (const child of Object.values(item.children!)) accumulateLeafValues(child, totals)
-  } else if (item.cost && typeof item.cost.amount === 'number' && !isNaN(item.cost.amount) && item.cost.unit) {
-    totals[item.cost.unit] = item.cost.amount
+  // Leaf fast path (most rendered rows): its own cost is the whole total
+  if (!hasChildren) {
+    return hasCost ? { [item.cost!.unit]: { actual: Math.round(item.cost!.amount * 100) / 100 } } : {}
   }
 
+  const totals: Record<string, number> = {}
+  for (const child of Object.values(item.children!)) accumulateLeafValues(child, totals)
+
   const out: Record<string, ValueTotal> = {}
   for (const unit of Object.keys(totals)) {
     // Round once, after all additions — rounding per recursion level would compound error.
     out[unit] = { actual: Math.round(totals[unit] * 100) / 100 }
   }
 
-  if (hasChildren && item.cost && typeof item.cost.amount === 'number' && !isNaN(item.cost.amount) && item.cost.unit) {
-    const unit = item.cost.unit
-    out[unit] = { actual: out[unit]?.actual ?? 0, target: Math.round(item.cost.amount * 100) / 100 }
+  if (hasCost) {
+    const unit = item.cost!.unit
+    out[unit] = { actual: out[unit]?.actual ?? 0, target: Math.round(item.cost!.amount * 100) / 100 }
   }
 
   return out
@@ -266,7 +311,8 @@ function parseMarkdownStructure(text: string): Record<string, StructureItem> {
   // heading regex is "$"-anchored per line and "." doesn't consume "\r", so a
   // stray trailing "\r" would otherwise make every heading silently fail to match.
   for (const rawLine of text.replace(/\r\n?/g, '\n').split('\n')) {
-    const headingMatch = rawLine.match(/^(#+)\s+(.*)$/)
+    // Most lines are context text, not headings — skip the regex unless the line starts with '#'
+    const headingMatch = rawLine.startsWith('#') ? rawLine.match(/^(#+)\s+(.*)$/) : null
     if (headingMatch) {
       flushContext()
       const depth = headingMatch[1].length
@@ -293,10 +339,14 @@ function parseMarkdownStructure(text: string): Record<string, StructureItem> {
     const trimmed = rawLine.trim()
     if (trimmed === 'Checkpoints:') continue
 
-    const cpMatch = trimmed.match(/^-\s+(\d{4}-\d{2}-\d{2}):\s*(\d+\/\d+)\s*$/)
+    const cpMatch = trimmed.startsWith('-')
+      ? trimmed.match(/^-\s+(\d{4}-\d{2}-\d{2}):\s*(\d+\/\d+)\s*$/)
+      : null
     const currentItem = stack[stack.length - 1].item
     if (cpMatch && currentItem) {
-      currentItem.checkpoints = [...(currentItem.checkpoints ?? []), { date: cpMatch[1], progress: cpMatch[2] }]
+      // Items are freshly built by this parser, so appending in place is safe
+      if (!currentItem.checkpoints) currentItem.checkpoints = []
+      currentItem.checkpoints.push({ date: cpMatch[1], progress: cpMatch[2] })
       continue
     }
 
@@ -307,25 +357,34 @@ function parseMarkdownStructure(text: string): Record<string, StructureItem> {
 }
 
 // ── Structure serializer (mirrors parseMarkdownStructure) ─────────────────────
-export function serializeStructure(items: Record<string, StructureItem>, depth = 1): string {
+// Every level appends into one shared fragment list that's joined once at the
+// end — joining per level would re-copy each subtree's text once per ancestor.
+function appendStructure(items: Record<string, StructureItem>, depth: number, out: string[]): void {
   const hashes = '#'.repeat(depth)
-  const blocks = Object.values(items).map(item => {
+  let first = true
+  for (const item of Object.values(items)) {
+    if (!first) out.push('\n')  // blank line between sibling blocks
+    first = false
     const progressSuffix = item.progress !== undefined ? ` (${item.progress})` : ''
     const costText = formatCost(item.cost)
     const costSuffix = costText ? ` ${costText}` : ''
-    let block = `${hashes} ${item.title}${progressSuffix}${costSuffix}\n`
-    if (item.context) block += `${item.context}\n`
+    out.push(`${hashes} ${item.title}${progressSuffix}${costSuffix}\n`)
+    if (item.context) out.push(`${item.context}\n`)
     if (item.checkpoints && item.checkpoints.length) {
-      block += `Checkpoints:\n`
+      out.push(`Checkpoints:\n`)
       for (const cp of [...item.checkpoints].sort((a, b) => a.date.localeCompare(b.date))) {
-        block += `- ${cp.date}: ${cp.progress}\n`
+        out.push(`- ${cp.date}: ${cp.progress}\n`)
       }
     }
     if (item.children && Object.keys(item.children).length)
-      block += serializeStructure(item.children, depth + 1)
-    return block
-  })
-  return blocks.join('\n')
+      appendStructure(item.children, depth + 1, out)
+  }
+}
+
+export function serializeStructure(items: Record<string, StructureItem>, depth = 1): string {
+  const out: string[] = []
+  appendStructure(items, depth, out)
+  return out.join('')
 }
 
 // Serialize a single item (and its children) — used for single-item clipboard copy.
@@ -567,13 +626,13 @@ export async function createGraph(name: string, description = '', initialContent
 
   const meta: GraphInfo = {
     name,
-    display_name: name.replace(/_/g, ' ').replace(/\b\w/g, c => c.toUpperCase()),
+    display_name: titleFromKey(name),
     path: `structures/${name}.txt`,
     modified_at: new Date().toISOString(),
     size: 0,
     description,
     version: '1.0',
-    icon: iconFor(name),
+    icon: iconForGraph(name),
   }
   saveMeta(name, meta)
   return meta
@@ -1,4 +1,4 @@
-import { useRef, useState, type CSSProperties } from 'react'
+import { useState, type CSSProperties } from 'react'
 import { StructureItem, UpdatePayload, getItemDueDate, sumValues, formatValueTotals } from '../api/localClient'
 import { parseLocalDate, daysUntil } from '../utils/dates'
 import { useItemSwipe } from '../hooks/useItemSwipe'
@@ -8,7 +8,7 @@ interface SectionProps {
   itemKey: string
   item: StructureItem
   parentPath: string
-  colorIndex: number
+  // Receives the item's real path — Overview virtual items pass their originalPath
   onItemClick: (path: string) => void
   onEditClick: (path: string, name: string, data: StructureItem) => void
   editingPath?: string | null
@@ -42,23 +42,27 @@ interface SectionProps {
   rawText?: string
 }
 
-// Helper to calculate due date category for CSS class
-function getDueCategory(dueDate: string | undefined): string | null {
-  if (!dueDate) return null
-  const diffDays = daysUntil(dueDate)
-  if (diffDays < 0) return 'overdue'
-  if (diffDays === 0) return 'today'
-  if (diffDays <= 7) return 'soon'
-  return 'later'
+// Static inline styles, shared by every row instead of re-allocated per render
+const LAYER1_WRAPPER_STYLE: CSSProperties = { display: 'flex', alignItems: 'stretch', gap: 0 }
+const LAYER3_CONTEXT_STYLE: CSSProperties = { marginLeft: '0.5rem' }
+// The checkpoint delta badge only ever takes one of two colors
+const DELTA_STYLES: Record<'--status-good' | '--status-bad', CSSProperties> = {
+  '--status-good': { color: 'var(--status-good)' },
+  '--status-bad': { color: 'var(--status-bad)' },
 }
 
-// Helper to format due date display — today shows "Today", tomorrow "2d", etc.
-function formatDueDate(dueDate: string): string {
-  const diffDays = daysUntil(dueDate)
-  if (diffDays < 0) return `${Math.abs(diffDays)}d overdue`
-  if (diffDays === 0) return 'Today'
-  if (diffDays <= 7) return `${diffDays + 1}d`
-  return parseLocalDate(dueDate).toLocaleDateString('en-US', { month: 'short', day: 'numeric' })
+// toLocaleDateString with options builds a new formatter on every call;
+// one shared Intl formatter gives the same "Mar 5" output
+const SHORT_DATE = new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric' })
+
+// Due badge for a row: CSS category plus label ("Today", "2d", "3d overdue",
+// "Mar 5"). One daysUntil per row, shared by both instead of one each.
+function dueBadge(dueDate: string, today?: Date): { category: string; text: string } {
+  const diffDays = daysUntil(dueDate, today)
+  if (diffDays < 0) return { category: 'overdue', text: `${Math.abs(diffDays)}d overdue` }
+  if (diffDays === 0) return { category: 'today', text: 'Today' }
+  if (diffDays <= 7) return { category: 'soon', text: `${diffDays + 1}d` }
+  return { category: 'later', text: SHORT_DATE.format(parseLocalDate(dueDate)) }
 }
 
 // Helper to parse "X/Y" progress — pct capped at 100 for bar width
@@ -79,19 +83,20 @@ function getExpectedPct(
   today: Date = new Date(),
 ): number | null {
   if (!checkpoints || checkpoints.length < 1) return null
+  // Each date is parsed once here; the scan below only compares timestamps
   const points = checkpoints
-    .map(cp => ({ date: cp.date, pct: parseProgress(cp.progress)?.pct }))
-    .filter((p): p is { date: string; pct: number } => p.pct !== undefined && !isNaN(parseLocalDate(p.date).getTime()))
+    .map(cp => ({ date: cp.date, time: parseLocalDate(cp.date).getTime(), pct: parseProgress(cp.progress)?.pct }))
+    .filter((p): p is { date: string; time: number; pct: number } => p.pct !== undefined && !isNaN(p.time))
     .sort((a, b) => a.date.localeCompare(b.date))
   if (points.length < 1) return null
 
   const t0 = new Date(today); t0.setHours(0, 0, 0, 0)
   const t = t0.getTime()
-  if (t < parseLocalDate(points[0].date).getTime()) return null
+  if (t < points[0].time) return null
 
   for (let i = 0; i < points.length - 1; i++) {
-    const d0 = parseLocalDate(points[i].date).getTime()
-    const d1 = parseLocalDate(points[i + 1].date).getTime()
+    const d0 = points[i].time
+    const d1 = points[i + 1].time
     if (t <= d1) {
       const frac = d1 === d0 ? 1 : (t - d0) / (d1 - d0)
       return points[i].pct + frac * (points[i + 1].pct - points[i].pct)
@@ -100,17 +105,29 @@ function getExpectedPct(
   return points[points.length - 1].pct  // past all checkpoints — hold flat, no extrapolation
 }
 
-// Signed delta badge ("+8%"/"−8%") plus which status color to use. Null when
-// there's no computable expected value, or actual already matches it exactly.
-function formatCheckpointDelta(
+// Actual vs. expected-by-today progress for one row — parsed and interpolated
+// once, then shared by the delta badge and the background fill
+interface ProgressStatus { pct: number; expectedPct: number | null }
+
+function getProgressStatus(
   progress: string | undefined,
   checkpoints: { date: string; progress: string }[] | undefined,
-): { text: string; varName: '--status-good' | '--status-bad' } | null {
+  today?: Date,
+): ProgressStatus | null {
   const pi = parseProgress(progress)
   if (!pi) return null
-  const expectedPct = getExpectedPct(checkpoints)
-  if (expectedPct === null || Math.round(pi.pct) === Math.round(expectedPct)) return null
-  const delta = Math.round(pi.pct - expectedPct)
+  return { pct: pi.pct, expectedPct: getExpectedPct(checkpoints, today) }
+}
+
+// Signed delta badge ("+8%"/"−8%") plus which status color to use. Null when
+// there's no computable expected value, or actual already matches it exactly.
+function formatCheckpointDelta(
+  status: ProgressStatus | null,
+): { text: string; varName: '--status-good' | '--status-bad' } | null {
+  if (!status) return null
+  const { pct, expectedPct } = status
+  if (expectedPct === null || Math.round(pct) === Math.round(expectedPct)) return null
+  const delta = Math.round(pct - expectedPct)
   if (delta === 0) return null
   return { text: `${delta > 0 ? '+' : '−'}${Math.abs(delta)}%`, varName: delta > 0 ? '--status-good' : '--status-bad' }
 }
@@ -119,23 +136,21 @@ function formatCheckpointDelta(
 // checkpoints give a computable "expected by today" value that differs from
 // actual, a second gradient layer shows the gap as a good/bad-colored sliver.
 function progressFillStyle(
-  progress: string | undefined,
-  checkpoints: { date: string; progress: string }[] | undefined,
+  status: ProgressStatus | null,
   color: string,
 ): CSSProperties | undefined {
-  const pi = parseProgress(progress)
-  if (!pi) return undefined
+  if (!status) return undefined
+  const { pct, expectedPct } = status
 
-  const expectedPct = getExpectedPct(checkpoints)
-  if (expectedPct === null || pi.pct === expectedPct) {
+  if (expectedPct === null || pct === expectedPct) {
     return {
-      backgroundImage: `linear-gradient(90deg, color-mix(in srgb, ${color} 11%, transparent) ${pi.pct}%, transparent ${pi.pct}%)`,
+      backgroundImage: `linear-gradient(90deg, color-mix(in srgb, ${color} 11%, transparent) ${pct}%, transparent ${pct}%)`,
     }
   }
 
-  const lo = Math.min(pi.pct, expectedPct)
-  const hi = Math.max(pi.pct, expectedPct)
-  const statusVar = pi.pct > expectedPct ? '--status-good' : '--status-bad'
+  const lo = Math.min(pct, expectedPct)
+  const hi = Math.max(pct, expectedPct)
+  const statusVar = pct > expectedPct ? '--status-good' : '--status-bad'
   return {
     backgroundImage: [
       `linear-gradient(90deg, color-mix(in srgb, ${color} 11%, transparent) ${lo}%, transparent ${lo}%)`,
@@ -157,7 +172,6 @@ function Section({
   itemKey,
   item,
   parentPath,
-  colorIndex: _colorIndex,
   onItemClick,
   onEditClick,
   editingPath = null,
@@ -182,8 +196,6 @@ function Section({
   const itemPath = parentPath ? `${parentPath}.${itemKey}` : itemKey
   const title = item.title || itemKey
 
-  const sectionRef = useRef<HTMLDivElement>(null)
-
   // Editable unless it's a virtual time-view item or explicitly non-editable —
   // gates the right-click menu, swipe gestures, and the Delete button inside the editor.
   const rowEditable = !isTimeView && !item.nonEditable
@@ -192,7 +204,7 @@ function Section({
   const makeSwipeHandlers = useItemSwipe()
 
   // Get child items for layer2
-  const children = item.children || {}
+  const children: Record<string, StructureItem> = item.children || {}
   const childEntries = Object.entries(children)
 
   const [copied, setCopied] = useState(false)
@@ -206,7 +218,7 @@ function Section({
 
   if (showRaw && rawText !== undefined) {
     return (
-      <div className="section" ref={sectionRef}>
+      <div className="section">
         <pre className="section-raw">{rawText}</pre>
         {!isTimeView && onCopyClick && (
           <div className="section-copy-zone" title="Copy to clipboard" onClick={handleCopy}>
@@ -217,15 +229,21 @@ function Section({
     )
   }
 
-  const layer1Delta = formatCheckpointDelta(item.progress, item.checkpoints)
+  // One clock read per render, shared by every row's due/checkpoint helpers
+  const today = new Date()
+  const layer1Status = getProgressStatus(item.progress, item.checkpoints, today)
+  const layer1Delta = formatCheckpointDelta(layer1Status)
+  const layer1ProgressText = formatProgressText(item.progress)
   const layer1Value = formatValueTotals(sumValues(item))
+  const layer1DueDate = getItemDueDate(item)
+  const layer1Due = layer1DueDate && !minimal ? dueBadge(layer1DueDate, today) : null
 
   return (
-    <div className="section" ref={sectionRef}>
+    <div className="section">
       <div className="section-body">
       {/* Layer 1 - Main category */}
       <div className="layer1-container">
-        <div className="layer1-wrapper" style={{ display: 'flex', alignItems: 'stretch', gap: 0 }}>
+        <div className="layer1-wrapper" style={LAYER1_WRAPPER_STYLE}>
           {showLoading && <span className="loading-spinner" title="Syncing...">⟳</span>}
           {editingPath === itemPath && editInline ? (
             <InlineItemEditor
@@ -239,7 +257,7 @@ function Section({
             <>
               <div
                 className={`layer1${!editInline && (editingPath === itemPath || creatingPath === itemPath) ? ' item-editing' : ''}`}
-                style={progressFillStyle(item.progress, item.checkpoints, 'var(--blue-medium)')}
+                style={progressFillStyle(layer1Status, 'var(--blue-medium)')}
                 onContextMenu={rowEditable ? (e) => onContextMenu?.(e, itemPath, true) : undefined}
                 {...(rowEditable
                   ? makeSwipeHandlers(
@@ -257,23 +275,23 @@ function Section({
                   // edge, leaving little room for a leftward drag — so a plain tap opens
                   // edit too, same as left-swipe. Non-editable rows (e.g. the virtual
                   // Overview item) keep the old click behavior.
-                  onClick={() => rowEditable ? onEditClick(itemPath, title, item) : onItemClick(itemPath)}
+                  onClick={() => rowEditable ? onEditClick(itemPath, title, item) : onItemClick(item.originalPath ?? itemPath)}
                 >
                   {title}
-                  {!minimal && formatProgressText(item.progress) && (
-                    <span className="item-progress-inline">{formatProgressText(item.progress)}</span>
+                  {!minimal && layer1ProgressText && (
+                    <span className="item-progress-inline">{layer1ProgressText}</span>
                   )}
                   {!minimal && layer1Delta && (
-                    <span className="item-checkpoint-delta" style={{ color: `var(${layer1Delta.varName})` }}>
+                    <span className="item-checkpoint-delta" style={DELTA_STYLES[layer1Delta.varName]}>
                       {layer1Delta.text}
                     </span>
                   )}
                   {!minimal && layer1Value && (
                     <span className="item-cost">{layer1Value}</span>
                   )}
-                  {!minimal && getItemDueDate(item) && (
-                    <span className={`item-due due-${getDueCategory(getItemDueDate(item))}`}>
-                      {formatDueDate(getItemDueDate(item)!)}
+                  {!minimal && layer1Due && (
+                    <span className={`item-due due-${layer1Due.category}`}>
+                      {layer1Due.text}
                     </span>
                   )}
                 </span>
@@ -291,12 +309,16 @@ function Section({
       {depth >= 2 && <div className="layer2-section">
         {childEntries.map(([childKey, childItem]) => {
           const childPath = `${itemPath}.${childKey}`
-          const childTitle = (childItem as StructureItem).title || childKey
-          const grandchildren = (childItem as StructureItem).children || {}
+          const childTitle = childItem.title || childKey
+          const grandEntries = childItem.children ? Object.entries(childItem.children) : []
           // Check if this child item is editable
-          const childRowEditable = rowEditable && !(childItem as StructureItem).nonEditable && !(childItem as StructureItem).originalPath
-          const layer2Delta = formatCheckpointDelta((childItem as StructureItem).progress, (childItem as StructureItem).checkpoints)
-          const layer2Value = formatValueTotals(sumValues(childItem as StructureItem))
+          const childRowEditable = rowEditable && !childItem.nonEditable && !childItem.originalPath
+          const layer2Status = getProgressStatus(childItem.progress, childItem.checkpoints, today)
+          const layer2Delta = formatCheckpointDelta(layer2Status)
+          const layer2ProgressText = formatProgressText(childItem.progress)
+          const layer2Value = formatValueTotals(sumValues(childItem))
+          const layer2DueDate = getItemDueDate(childItem)
+          const layer2Due = layer2DueDate && !minimal ? dueBadge(layer2DueDate, today) : null
 
           return (
             <div key={childKey} className="layer2-container">
@@ -306,7 +328,7 @@ function Section({
                     {editingPath === childPath && editInline ? (
                       <InlineItemEditor
                         itemKey={childKey}
-                        item={childItem as StructureItem}
+                        item={childItem}
                         onSave={(data) => onInlineSave?.(childPath, data)}
                         onCancel={() => onInlineCancel?.()}
                         onDelete={childRowEditable ? () => onInlineDelete?.(childPath) : undefined}
@@ -315,31 +337,31 @@ function Section({
                       <>
                         <div
                           className={`layer2${!editInline && (editingPath === childPath || creatingPath === childPath) ? ' item-editing' : ''}`}
-                          style={progressFillStyle((childItem as StructureItem).progress, (childItem as StructureItem).checkpoints, 'currentColor')}
+                          style={progressFillStyle(layer2Status, 'currentColor')}
                           onContextMenu={childRowEditable ? (e) => onContextMenu?.(e, childPath, depth >= 3) : undefined}
                           {...(childRowEditable
                             ? makeSwipeHandlers(
-                                () => onEditClick(childPath, childTitle, childItem as StructureItem),
+                                () => onEditClick(childPath, childTitle, childItem),
                                 () => { if (depth >= 3) onSubCreateStart?.(childPath) },
                               )
                             : {})}
                         >
-                          <span className="item-title" onClick={() => onItemClick(childPath)}>
+                          <span className="item-title" onClick={() => onItemClick(childItem.originalPath ?? childPath)}>
                             {childTitle}
-                            {!minimal && formatProgressText((childItem as StructureItem).progress) && (
-                              <span className="item-progress-inline">{formatProgressText((childItem as StructureItem).progress)}</span>
+                            {!minimal && layer2ProgressText && (
+                              <span className="item-progress-inline">{layer2ProgressText}</span>
                             )}
                             {!minimal && layer2Delta && (
-                              <span className="item-checkpoint-delta" style={{ color: `var(${layer2Delta.varName})` }}>
+                              <span className="item-checkpoint-delta" style={DELTA_STYLES[layer2Delta.varName]}>
                                 {layer2Delta.text}
                               </span>
                             )}
                             {!minimal && layer2Value && (
                               <span className="item-cost">{layer2Value}</span>
                             )}
-                            {!minimal && getItemDueDate(childItem as StructureItem) && (
-                              <span className={`item-due due-${getDueCategory(getItemDueDate(childItem as StructureItem))}`}>
-                                {formatDueDate(getItemDueDate(childItem as StructureItem)!)}
+                            {!minimal && layer2Due && (
+                              <span className={`item-due due-${layer2Due.category}`}>
+                                {layer2Due.text}
                               </span>
                             )}
                           </span>
@@ -348,21 +370,25 @@ function Section({
                     )}
                   </div>
                   {/* Context for layer2 */}
-                  {showContext && (childItem as StructureItem).context && (
-                    <div className="item-context">{(childItem as StructureItem).context}</div>
+                  {showContext && childItem.context && (
+                    <div className="item-context">{childItem.context}</div>
                   )}
                 </div>
 
                 {/* Layer 3 - Items */}
-                {depth >= 3 && (Object.keys(grandchildren).length > 0 || (creatingPath === childPath && editInline)) && (
+                {depth >= 3 && (grandEntries.length > 0 || (creatingPath === childPath && editInline)) && (
                   <div className="layer3-container">
-                    {Object.entries(grandchildren).map(([grandKey, grandItem]) => {
+                    {grandEntries.map(([grandKey, grandItem]) => {
                       const grandPath = `${childPath}.${grandKey}`
-                      const grandTitle = (grandItem as StructureItem).title || grandKey
+                      const grandTitle = grandItem.title || grandKey
                       // Check if this grandchild item is editable
-                      const grandRowEditable = rowEditable && !(grandItem as StructureItem).nonEditable && !(grandItem as StructureItem).originalPath
-                      const layer3Delta = formatCheckpointDelta((grandItem as StructureItem).progress, (grandItem as StructureItem).checkpoints)
-                      const layer3Value = formatValueTotals(sumValues(grandItem as StructureItem))
+                      const grandRowEditable = rowEditable && !grandItem.nonEditable && !grandItem.originalPath
+                      const layer3Status = getProgressStatus(grandItem.progress, grandItem.checkpoints, today)
+                      const layer3Delta = formatCheckpointDelta(layer3Status)
+                      const layer3ProgressText = formatProgressText(grandItem.progress)
+                      const layer3Value = formatValueTotals(sumValues(grandItem))
+                      const layer3DueDate = getItemDueDate(grandItem)
+                      const layer3Due = layer3DueDate && !minimal ? dueBadge(layer3DueDate, today) : null
 
                       return (
                         <div key={grandKey}>
@@ -370,7 +396,7 @@ function Section({
                             {editingPath === grandPath && editInline ? (
                               <InlineItemEditor
                                 itemKey={grandKey}
-                                item={grandItem as StructureItem}
+                                item={grandItem}
                                 onSave={(data) => onInlineSave?.(grandPath, data)}
                                 onCancel={() => onInlineCancel?.()}
                                 onDelete={grandRowEditable ? () => onInlineDelete?.(grandPath) : undefined}
@@ -379,33 +405,33 @@ function Section({
                               <>
                                 <div
                                   className={`layer3-item${!editInline && editingPath === grandPath ? ' item-editing' : ''}`}
-                                  style={progressFillStyle((grandItem as StructureItem).progress, (grandItem as StructureItem).checkpoints, 'currentColor')}
+                                  style={progressFillStyle(layer3Status, 'currentColor')}
                                   onContextMenu={grandRowEditable ? (e) => onContextMenu?.(e, grandPath, false) : undefined}
                                   {...(grandRowEditable
                                     ? makeSwipeHandlers(
-                                        () => onEditClick(grandPath, grandTitle, grandItem as StructureItem),
+                                        () => onEditClick(grandPath, grandTitle, grandItem),
                                         () => {},
                                       )
                                     : {})}
                                 >
-                                  <span className="item-title" onClick={() => onItemClick(grandPath)}>
+                                  <span className="item-title" onClick={() => onItemClick(grandItem.originalPath ?? grandPath)}>
                                     {grandTitle}
-                                    {!minimal && formatProgressText((grandItem as StructureItem).progress) && (
+                                    {!minimal && layer3ProgressText && (
                                       <span className="item-progress-inline">
-                                        {formatProgressText((grandItem as StructureItem).progress)}
+                                        {layer3ProgressText}
                                       </span>
                                     )}
                                     {!minimal && layer3Delta && (
-                                      <span className="item-checkpoint-delta" style={{ color: `var(${layer3Delta.varName})` }}>
+                                      <span className="item-checkpoint-delta" style={DELTA_STYLES[layer3Delta.varName]}>
                                         {layer3Delta.text}
                                       </span>
                                     )}
                                     {!minimal && layer3Value && (
                                       <span className="item-cost">{layer3Value}</span>
                                     )}
-                                    {!minimal && getItemDueDate(grandItem as StructureItem) && (
-                                      <span className={`item-due due-${getDueCategory(getItemDueDate(grandItem as StructureItem))}`}>
-                                        {formatDueDate(getItemDueDate(grandItem as StructureItem)!)}
+                                    {!minimal && layer3Due && (
+                                      <span className={`item-due due-${layer3Due.category}`}>
+                                        {layer3Due.text}
                                       </span>
                                     )}
                                   </span>
@@ -414,9 +440,9 @@ function Section({
                             )}
                           </div>
                           {/* Context for layer3 */}
-                          {showContext && (grandItem as StructureItem).context && (
-                            <div className="item-context" style={{ marginLeft: '0.5rem' }}>
-                              {(grandItem as StructureItem).context}
+                          {showContext && grandItem.context && (
+                            <div className="item-context" style={LAYER3_CONTEXT_STYLE}>
+                              {grandItem.context}
                             </div>
                           )}
                         </div>
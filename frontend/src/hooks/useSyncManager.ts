@@ -112,6 +112,7 @@ export function useSyncManager(queryClient: QueryClient) {
       const filesToPatch: Record<string, { content: string } | null> = {}
       const updatedMeta: Record<string, GistGraphMeta> = { ...remoteMeta }
       const tombstonesToClear: string[] = []
+      let metaChanged = false
 
       const deletedGraphs = getDeletedGraphs()
 
@@ -131,6 +132,7 @@ export function useSyncManager(queryClient: QueryClient) {
             if (content) {
               filesToPatch[`${name}.txt`] = { content }
               updatedMeta[name] = metaFrom(local)
+              metaChanged = true
               direction = 'push'
             }
           } else if (!local && hasRemote) {
@@ -141,6 +143,7 @@ export function useSyncManager(queryClient: QueryClient) {
               // Deleted locally and deletion is newer → remove from Gist
               filesToPatch[`${name}.txt`] = null
               delete updatedMeta[name]
+              metaChanged = true
               tombstonesToClear.push(name)
               direction = 'push'
             } else {
@@ -158,8 +161,13 @@ export function useSyncManager(queryClient: QueryClient) {
               const s = await fetchLocalStructure(name)
               const content = serializeStructure(s.structure).trim()
               if (content) {
-                filesToPatch[`${name}.txt`] = { content }
+                // Touched locally but the text matches the Gist (e.g. an edit that was
+                // reverted, or a metadata-only change) — re-upload only the meta entry
+                if (content !== gistData.files[`${name}.txt`]?.content) {
+                  filesToPatch[`${name}.txt`] = { content }
+                }
                 updatedMeta[name] = metaFrom(local)
+                metaChanged = true
                 direction = 'push'
               }
             } else if (rt > lt) {
@@ -180,7 +188,7 @@ export function useSyncManager(queryClient: QueryClient) {
       }
 
       // Single PATCH for all pushed graphs + updated meta
-      if (Object.keys(filesToPatch).length > 0) {
+      if (metaChanged) {
         filesToPatch[META_FILE] = { content: JSON.stringify(updatedMeta, null, 2) }
         await patchGist(token, gid, filesToPatch)
         for (const name of tombstonesToClear) clearDeletion(name)
@@ -191,8 +199,12 @@ export function useSyncManager(queryClient: QueryClient) {
       setSyncStatuses(newStatuses)
       queryClient.invalidateQueries({ queryKey: ['graphs'] })
 
-      const pushed = Object.values(newStatuses).filter(s => s.direction === 'push' && !s.error).length
-      const pulled = Object.values(newStatuses).filter(s => s.direction === 'pull' && !s.error).length
+      let pushed = 0, pulled = 0
+      for (const s of Object.values(newStatuses)) {
+        if (s.error) continue
+        if (s.direction === 'push') pushed++
+        else if (s.direction === 'pull') pulled++
+      }
 
       if (errors.length) {
         const msg = errors.join('; ')
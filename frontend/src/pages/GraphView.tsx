@@ -5,7 +5,7 @@ import { useStructure, useGraphs, useUpdateItem, useDeleteItem, useReorderItem,
 import { useModalBackButton } from '../hooks/useModalBackButton'
 import { useLongPress } from '../hooks/useLongPress'
 import { useTheme } from '../context/ThemeContext'
-import { StructureItem, UpdatePayload, pasteItems, serializeItem, getItemDueDate } from '@api'
+import { StructureItem, UpdatePayload, pasteItems, serializeItem, getItemDueDate, titleFromKey, walkItems } from '@api'
 import InlineItemEditor from '../components/InlineItemEditor'
 import MobileEditSheet from '../components/MobileEditSheet'
 import Notification from '../components/Notification'
@@ -21,13 +21,18 @@ function isTouchDevice(): boolean {
   return typeof window !== 'undefined' && !!window.matchMedia?.('(hover: none) and (pointer: coarse)').matches
 }
 
-// Color assignment based on index
-const COLORS = ['sky', 'indigo', 'fuchsia']
-
 // View depths cycled by tapping the depth button — 3 levels, 2 levels.
 // Raw (0) isn't part of the cycle; long-pressing the button jumps to it directly.
 const DEPTHS = [3, 2] as const
 
+// Overview buckets, in display order
+const TIME_CATEGORIES: Array<['over' | 'day' | 'week' | 'month', string]> = [
+  ['over', 'Overdue'], ['day', 'Today'], ['week', 'This Week'], ['month', 'This Month'],
+]
+const PROGRESS_CATEGORIES: Array<['not_started' | 'in_progress' | 'done', string]> = [
+  ['done', 'Done'],
+]
+
 function GraphView() {
   const location = useLocation()
   const { graphName } = useParams<{ graphName?: string }>()
@@ -169,8 +174,8 @@ function GraphView() {
   }
 
   // Due-date bucket
-  const getDueCategory = (dueDate: string): 'over' | 'day' | 'week' | 'month' | null => {
-    const diffDays = daysUntil(dueDate)
+  const getDueCategory = (dueDate: string, today?: Date): 'over' | 'day' | 'week' | 'month' | null => {
+    const diffDays = daysUntil(dueDate, today)
     if (diffDays < 0) return 'over'
     if (diffDays === 0) return 'day'
     if (diffDays <= 7) return 'week'
@@ -187,25 +192,21 @@ function GraphView() {
     return 'in_progress'
   }
 
-  // Recursively collect items with due dates
+  // Collect items with due dates
   const collectDueItems = (items: Record<string, StructureItem>, parentPath = ''): Array<{path: string, item: StructureItem, title: string}> => {
     const result: Array<{path: string, item: StructureItem, title: string}> = []
-    for (const [key, item] of Object.entries(items)) {
-      const itemPath = parentPath ? `${parentPath}.${key}` : key
+    walkItems(items, parentPath, (itemPath, key, item) => {
       if (getItemDueDate(item)) result.push({ path: itemPath, item, title: item.title || key })
-      if (item.children) result.push(...collectDueItems(item.children, itemPath))
-    }
+    })
     return result
   }
 
-  // Recursively collect items with progress values
+  // Collect items with progress values
   const collectProgressItems = (items: Record<string, StructureItem>, parentPath = ''): Array<{path: string, item: StructureItem, title: string}> => {
     const result: Array<{path: string, item: StructureItem, title: string}> = []
-    for (const [key, item] of Object.entries(items)) {
-      const itemPath = parentPath ? `${parentPath}.${key}` : key
+    walkItems(items, parentPath, (itemPath, key, item) => {
       if (item.progress !== undefined && item.progress !== null) result.push({ path: itemPath, item, title: item.title || key })
-      if (item.children) result.push(...collectProgressItems(item.children, itemPath))
-    }
+    })
     return result
   }
 
@@ -221,28 +222,51 @@ function GraphView() {
     return item?.children ? { ...item.children } : {}
   }
 
-  // Virtual items for a time category with absolute paths
-  const getTimeChildrenFromRoot = (
-    category: 'over' | 'day' | 'week' | 'month',
-    rootItems: Record<string, StructureItem>,
+  // Flatten collected items into read-only Overview entries keyed by their
+  // relative path, pointing back at the real item via originalPath
+  const toVirtualItems = (
+    collected: Array<{path: string, item: StructureItem, title: string}>,
     contextPrefix: string
   ): Record<string, StructureItem> => {
-    const filtered = collectDueItems(rootItems).filter(({ item }) => getDueCategory(getItemDueDate(item)!) === category)
     const result: Record<string, StructureItem> = {}
-    for (const { path: relPath, item, title } of filtered) {
+    // Siblings share a parent path, so each distinct parent's label is built once
+    const labelByParent = new Map<string, string>()
+    // Loop-invariant: without the context toggle no label is shown, so none is built
+    const showContext = viewMode === 'context'
+    for (const { path: relPath, item, title } of collected) {
       const key = relPath.replace(/\./g, '_')
       const fullPath = contextPrefix ? `${contextPrefix}.${relPath}` : relPath
-      const parentLabel = fullPath.split('.').slice(0, -1)
-        .map(p => p.replace(/_/g, ' ').replace(/\b\w/g, c => c.toUpperCase())).join(' › ')
+      let context: string | undefined
+      if (showContext) {
+        const lastDot = fullPath.lastIndexOf('.')
+        const parentPath = lastDot >= 0 ? fullPath.slice(0, lastDot) : ''
+        let parentLabel = labelByParent.get(parentPath)
+        if (parentLabel === undefined) {
+          parentLabel = parentPath ? parentPath.split('.')
+            .map(titleFromKey).join(' › ') : ''
+          labelByParent.set(parentPath, parentLabel)
+        }
+        if (parentLabel) context = `📍 ${parentLabel}`
+      }
       result[key] = {
-        ...item, title,
-        context: viewMode === 'context' && parentLabel ? `📍 ${parentLabel}` : undefined,
+        ...item, title, context,
         originalPath: fullPath, nonEditable: true, children: undefined,
       }
     }
     return result
   }
 
+  // Virtual items for a time category with absolute paths
+  const getTimeChildrenFromRoot = (
+    category: 'over' | 'day' | 'week' | 'month',
+    rootItems: Record<string, StructureItem>,
+    contextPrefix: string
+  ): Record<string, StructureItem> => {
+    const today = new Date()
+    const filtered = collectDueItems(rootItems).filter(({ item }) => getDueCategory(getItemDueDate(item)!, today) === category)
+    return toVirtualItems(filtered, contextPrefix)
+  }
+
   // Virtual items for a progress category with absolute paths
   const getProgressChildrenFromRoot = (
     category: 'not_started' | 'in_progress' | 'done',
@@ -253,19 +277,7 @@ function GraphView() {
       item.progress !== undefined && item.progress !== null &&
       getProgressCategory(item.progress as string) === category
     )
-    const result: Record<string, StructureItem> = {}
-    for (const { path: relPath, item, title } of filtered) {
-      const key = relPath.replace(/\./g, '_')
-      const fullPath = contextPrefix ? `${contextPrefix}.${relPath}` : relPath
-      const parentLabel = fullPath.split('.').slice(0, -1)
-        .map(p => p.replace(/_/g, ' ').replace(/\b\w/g, c => c.toUpperCase())).join(' › ')
-      result[key] = {
-        ...item, title,
-        context: viewMode === 'context' && parentLabel ? `📍 ${parentLabel}` : undefined,
-        originalPath: fullPath, nonEditable: true, children: undefined,
-      }
-    }
-    return result
+    return toVirtualItems(filtered, contextPrefix)
   }
 
   // Merged Overview section scoped to a path
@@ -275,21 +287,24 @@ function GraphView() {
     const children: Record<string, StructureItem> = {}
 
     if (viewPreferences.showTime) {
-      const timeCategories: Array<['over' | 'day' | 'week' | 'month', string]> = [
-        ['over', 'Overdue'], ['day', 'Today'], ['week', 'This Week'], ['month', 'This Month'],
-      ]
-      for (const [cat, label] of timeCategories) {
-        const items = getTimeChildrenFromRoot(cat, rootItems, scopePath)
+      // One walk, and one due-category check per item, bucketing into all four
+      // time categories at once
+      const buckets: Record<'over' | 'day' | 'week' | 'month', Array<{path: string, item: StructureItem, title: string}>> =
+        { over: [], day: [], week: [], month: [] }
+      const today = new Date()
+      for (const entry of collectDueItems(rootItems)) {
+        const cat = getDueCategory(getItemDueDate(entry.item)!, today)
+        if (cat) buckets[cat].push(entry)
+      }
+      for (const [cat, label] of TIME_CATEGORIES) {
+        const items = toVirtualItems(buckets[cat], scopePath)
         const count = Object.keys(items).length
         if (count > 0) children[cat] = { title: `${label} (${count})`, nonEditable: true, children: items }
       }
     }
 
     if (viewPreferences.showProgress) {
-      const progressCategories: Array<['not_started' | 'in_progress' | 'done', string]> = [
-        ['done', 'Done'],
-      ]
-      for (const [cat, label] of progressCategories) {
+      for (const [cat, label] of PROGRESS_CATEGORIES) {
         const items = getProgressChildrenFromRoot(cat, rootItems, scopePath)
         const count = Object.keys(items).length
         if (count > 0) children[cat] = { title: `${label} (${count})`, nonEditable: true, children: items }
@@ -341,8 +356,12 @@ function GraphView() {
     return baseItems
   }
 
-  // Get the raw items from structure
-  const rawItems = getCurrentItems()
+  // Get the raw items from structure — memoized, since the Overview scans walk the
+  // whole scoped subtree and would otherwise rerun on every render (drag hover,
+  // notifications, editor keystrokes...). The day key re-buckets the Overview's
+  // due categories once the date rolls over.
+  const dayKey = new Date().toDateString()
+  const rawItems = useMemo(() => getCurrentItems(), [structure, path, viewMode, viewPreferences, dayKey])
   
   // Server keys - stable reference using JSON string comparison
   const rawItemsKeyString = Object.keys(rawItems).join(',')
@@ -410,11 +429,15 @@ function GraphView() {
     
     if (!path) return crumbs
     
+    // Walk down the tree once alongside the path, instead of re-resolving every
+    // prefix from the root (which made the breadcrumb quadratic in depth)
     const parts = path.split('.')
     let currentPath = ''
+    let container: Record<string, StructureItem> | undefined = structure?.structure
     for (const part of parts) {
       currentPath = currentPath ? `${currentPath}.${part}` : part
-      const item = getItemByPath(structure, currentPath)
+      const item: StructureItem | undefined = container?.[part]
+      container = item?.children
       crumbs.push({
         label: item?.title || part,
         path: buildPath(currentPath)
@@ -423,30 +446,16 @@ function GraphView() {
     
     return crumbs
   }
+  // Only changes on navigation or structure edits — not on every drag/notification render
+  const breadcrumb = useMemo(() => getBreadcrumb(), [graphName, graphs, path, structure])
 
   // Handle item click - navigate to the item's PARENT page, so the clicked
   // item shows up as a 1st-level item alongside its siblings (with its own
   // children/grandchildren now visible as the 2nd/3rd levels below it).
   const handleItemClick = (itemPath: string) => {
-    const currentItems = getCurrentItems()
-
-    // Traverse the path to find the item (need this to resolve Overview/
-    // time-progress virtual items back to their real location)
-    const pathParts = itemPath.split('.')
-    const basePath = path ? path.split('.') : []
-    const relativeParts = pathParts.slice(basePath.length)
-
-    let targetItem: StructureItem | undefined = undefined
-    let current: Record<string, StructureItem> | undefined = currentItems
-
-    for (const part of relativeParts) {
-      if (!current) break
-      targetItem = current[part]
-      current = targetItem?.children
-    }
-
-    const realPath = (targetItem?.originalPath as string | undefined) ?? itemPath
-    const parentPath = realPath.split('.').slice(0, -1).join('.')
+    // Section already resolves Overview/time-progress virtual items to their
+    // real location (originalPath) when it emits the click
+    const parentPath = itemPath.split('.').slice(0, -1).join('.')
     navigate(buildPath(parentPath), { replace: true })
   }
 
@@ -484,7 +493,8 @@ function GraphView() {
             }
           }
           const addedKeys = result.added.filter((k: string) => k in freshItems)
-          const restKeys = Object.keys(freshItems).filter(k => !result.added.includes(k))
+          const addedSet = new Set<string>(result.added)
+          const restKeys = Object.keys(freshItems).filter(k => !addedSet.has(k))
           setLocalItems(freshItems)
           setLocalOrder([...addedKeys, ...restKeys])
         } else {
@@ -894,8 +904,6 @@ function GraphView() {
     return <div className="error">Error loading structure: {(error as Error).message}</div>
   }
 
-  const breadcrumb = getBreadcrumb()
-  
   // Check if we're in a virtual view (time or progress - items can't be edited/reordered)
   const isVirtualView = !!(path && path.split('.').includes('overview'))
 
@@ -1055,7 +1063,6 @@ function GraphView() {
                 itemKey={key}
                 item={item as StructureItem}
                 parentPath={path || ''}
-                colorIndex={index % COLORS.length}
                 onItemClick={handleItemClick}
                 onEditClick={handleEditClick}
                 editingPath={inlineEdit?.path || null}
@@ -1120,7 +1127,6 @@ function GraphView() {
               itemKey="overview"
               item={displayItems['overview'] as StructureItem}
               parentPath={path || ''}
-              colorIndex={displayOrder.indexOf('overview') % COLORS.length}
               onItemClick={handleItemClick}
               onEditClick={handleEditClick}
               editingPath={inlineEdit?.path || null}
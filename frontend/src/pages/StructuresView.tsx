@@ -3,7 +3,7 @@ import { useNavigate } from 'react-router-dom'
 import { useQueryClient } from '@tanstack/react-query'
 import { useTheme } from '../context/ThemeContext'
 import { useColorScheme } from '../context/ColorSchemeContext'
-import { createGraph, fetchStructureText, updateGraph, deleteGraph, GraphInfo } from '@api'
+import { createGraph, fetchStructureText, updateGraph, deleteGraph, iconForGraph, GraphInfo } from '@api'
 import { useGraphs } from '../hooks/useGraph'
 import { useModalBackButton } from '../hooks/useModalBackButton'
 import { useLongPress } from '../hooks/useLongPress'
@@ -14,13 +14,11 @@ import AgentAccessGuide from '../components/AgentAccessGuide'
 import { GRAPH_TEMPLATES, GraphTemplate, resolveTemplateDates } from '../data/graphTemplates'
 import './StructuresView.css'
 
-// Icons for different graph types (randomly assigned based on name hash)
-const GRAPH_ICONS = ['📊', '🎯', '📚', '💼', '🏠', '🌟', '🚀', '💡', '🎨', '🔬']
-
-function getIconForGraph(name: string): string {
-  const hash = name.split('').reduce((acc, char) => acc + char.charCodeAt(0), 0)
-  return GRAPH_ICONS[hash % GRAPH_ICONS.length]
-}
+// Card title colors, cycling green/blue/purple/brown with the "-alt" shade on
+// even indices. Both cycles line up every 4 cards, so the class strings are
+// built once here rather than per card per render.
+const CARD_COLORS = ['green', 'blue', 'purple', 'brown']
+const CARD_COLOR_CLASSES = CARD_COLORS.map((color, i) => i % 2 === 0 ? `color-${color}-alt` : `color-${color}`)
 
 function StructuresView() {
   const navigate = useNavigate()
@@ -171,7 +169,7 @@ function StructuresView() {
       await updateGraph(graph.name, {
         display_name: displayName,
         description,
-        icon: graph.icon || getIconForGraph(graph.name),
+        icon: graph.icon || iconForGraph(graph.name),
       })
       showNotification('Graph updated!')
       setInlineEditGraph(null)
@@ -291,9 +289,7 @@ function StructuresView() {
               </div>
             </div>
             {GRAPH_TEMPLATES.map((tpl, index) => {
-              const COLORS = ['green', 'blue', 'purple', 'brown']
-              const color = COLORS[index % COLORS.length]
-              const colorClass = index % 2 === 0 ? `color-${color}-alt` : `color-${color}`
+              const colorClass = CARD_COLOR_CLASSES[index % CARD_COLOR_CLASSES.length]
               return (
                 <div
                   key={tpl.name}
@@ -345,9 +341,7 @@ function StructuresView() {
 
         {/* Existing graphs */}
         {graphs.map((graph, index) => {
-          const COLORS = ['green', 'blue', 'purple', 'brown']
-          const color = COLORS[index % COLORS.length]
-          const colorClass = index % 2 === 0 ? `color-${color}-alt` : `color-${color}`
+          const colorClass = CARD_COLOR_CLASSES[index % CARD_COLOR_CLASSES.length]
 
           if (inlineEditGraph?.name === graph.name) {
             return (
@@ -10,12 +10,14 @@ export function parseLocalDate(dateStr: string): Date {
   return new Date(y, m - 1, d)
 }
 
-// Whole calendar days from `today` to `dateStr` (negative if in the past),
-// both compared at local midnight.
+const MS_PER_DAY = 1000 * 60 * 60 * 24
+
+// Integer day number of a Date's local calendar day (Date.UTC on its local
+// fields, so DST hours never enter the arithmetic)
+const dayNumber = (date: Date) =>
+  Date.UTC(date.getFullYear(), date.getMonth(), date.getDate()) / MS_PER_DAY
+
+// Whole calendar days from `today` to `dateStr` (negative if in the past).
 export function daysUntil(dateStr: string, today: Date = new Date()): number {
-  const t0 = new Date(today)
-  t0.setHours(0, 0, 0, 0)
-  const due = parseLocalDate(dateStr)
-  due.setHours(0, 0, 0, 0)
-  return Math.round((due.getTime() - t0.getTime()) / (1000 * 60 * 60 * 24))
+  return dayNumber(parseLocalDate(dateStr)) - dayNumber(today)
 }